@@ -1,9 +1,16 @@
+import copy
+import json
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Type
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader: Type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configure logging with basicConfig
 logging.basicConfig(
     level=logging.INFO,  # Set the log level to INFO
@@ -11,13 +18,75 @@ logging.basicConfig(
     format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
 )
 
+# OpenAPI specification file for each backend service
+_SERVICE_SPEC_FILES: Dict[str, str] = {
+    "k8s": "k8s_api.yaml",
+    "logs": "logs_api.yaml",
+    "metrics": "metrics_api.yaml",
+    "runbooks": "runbooks_api.yaml",
+}
+
+# Matches the port in server URLs like "http://localhost:8011/"
+_LOCALHOST_PORT_RE = re.compile(r"localhost:(\d+)(?=/|$)")
+
+# Parsed specs keyed by path, invalidated when the file's mtime or size changes
+_SPEC_CACHE: Dict[Path, Tuple[int, int, Dict]] = {}
+
+# Suffix of the on-disk parse cache that lets new processes skip YAML parsing
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _sidecar_path(spec_path: Path) -> Path:
+    """Path of the JSON cache file stored next to a spec"""
+    return spec_path.with_name(spec_path.name + _SIDECAR_SUFFIX)
+
+
+def _read_spec_sidecar(spec_path: Path, mtime_ns: int, size: int) -> Optional[Dict]:
+    """Return the cached parse of a spec if its sidecar matches the source file"""
+    try:
+        with open(_sidecar_path(spec_path), "r") as f:
+            data = json.load(f)
+        if data.get("mtime_ns") == mtime_ns and data.get("size") == size:
+            spec = data.get("spec")
+            if isinstance(spec, dict):
+                return spec
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _write_spec_sidecar(spec_path: Path, mtime_ns: int, size: int, spec: Dict) -> None:
+    """Persist a parsed spec next to its source, ignoring any failure"""
+    try:
+        payload = json.dumps({"mtime_ns": mtime_ns, "size": size, "spec": spec})
+        # Only keep the sidecar if JSON round-trips the spec exactly
+        if json.loads(payload)["spec"] != spec:
+            return
+        sidecar = _sidecar_path(spec_path)
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        tmp.write_text(payload)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass
+
 
 def _load_openapi_spec(spec_file: str) -> Dict:
     """Load OpenAPI specification from YAML file"""
     spec_path = Path(__file__).parent / "openapi_specs" / spec_file
     try:
-        with open(spec_path, "r") as f:
-            return yaml.safe_load(f)
+        st = spec_path.stat()
+        cached = _SPEC_CACHE.get(spec_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached[2])
+
+        spec = _read_spec_sidecar(spec_path, st.st_mtime_ns, st.st_size)
+        if spec is None:
+            with open(spec_path, "r") as f:
+                spec = yaml.load(f, Loader=_YamlLoader)
+            _write_spec_sidecar(spec_path, st.st_mtime_ns, st.st_size, spec)
+
+        _SPEC_CACHE[spec_path] = (st.st_mtime_ns, st.st_size, spec)
+        return copy.deepcopy(spec)
     except Exception as e:
         logging.error(f"Error loading OpenAPI spec {spec_file}: {str(e)}")
         return {}
@@ -34,13 +103,11 @@ def _get_localhost_port(spec_file: str) -> Optional[int]:
     for server in spec["servers"]:
         url = server.get("url", "")
         if "localhost:" in url:
-            try:
-                # Extract port from URL like "http://localhost:8011"
-                port_str = url.split("localhost:")[1].split("/")[0]
-                return int(port_str)
-            except (IndexError, ValueError) as e:
-                logging.error(f"Error parsing port from URL {url}: {str(e)}")
-                continue
+            # Extract port from URL like "http://localhost:8011"
+            match = _LOCALHOST_PORT_RE.search(url)
+            if match:
+                return int(match.group(1))
+            logging.error(f"Error parsing port from URL {url}")
 
     logging.error(f"No localhost server found in {spec_file}")
     return None
@@ -48,16 +115,9 @@ def _get_localhost_port(spec_file: str) -> Optional[int]:
 
 def get_server_ports() -> Dict[str, int]:
     """Get all server ports from OpenAPI specifications"""
-    port_mapping = {
-        "k8s": _get_localhost_port("k8s_api.yaml"),
-        "logs": _get_localhost_port("logs_api.yaml"),
-        "metrics": _get_localhost_port("metrics_api.yaml"),
-        "runbooks": _get_localhost_port("runbooks_api.yaml"),
-    }
-
-    # Filter out None values and log warnings
     valid_ports = {}
-    for service, port in port_mapping.items():
+    for service, spec_file in _SERVICE_SPEC_FILES.items():
+        port = _get_localhost_port(spec_file)
         if port is not None:
             valid_ports[service] = port
         else:
@@ -68,7 +128,8 @@ def get_server_ports() -> Dict[str, int]:
 
 def get_server_port(service: str) -> int:
     """Get port for a specific service"""
-    ports = get_server_ports()
-    if service not in ports:
+    spec_file = _SERVICE_SPEC_FILES.get(service)
+    port = _get_localhost_port(spec_file) if spec_file else None
+    if port is None:
         raise ValueError(f"Port not found for service: {service}")
-    return ports[service]
+    return port
@@ -112,34 +112,32 @@ def _parse_log_file(file_path: Path, pattern: Optional[str] = None):
                         logs = value
                         break
     else:
-        # Parse text log files
-        with open(file_path, "r") as f:
-            for line in f:
-                if pattern and pattern.lower() not in line.lower():
-                    continue
-                # Parse log line to extract timestamp, level, and message
-                parts = line.strip().split(" ", 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0]
-                    level_part = parts[1]
-                    service = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-
-                    # Extract log level from [LEVEL] format
-                    level = "INFO"
-                    if "[" in level_part and "]" in level_part:
-                        level = level_part.strip("[]")
-
-                    logs.append(
-                        {
-                            "timestamp": timestamp,
-                            "level": level,
-                            "service": service,
-                            "message": message,
-                        }
-                    )
-                else:
-                    logs.append({"message": line.strip()})
+        # Parse text log files; read once and split in C rather than per line
+        pattern_lower = pattern.lower() if pattern else None
+        for line in file_path.read_text().splitlines():
+            if pattern_lower and pattern_lower not in line.lower():
+                continue
+            line = line.strip()
+            # Parse log line to extract timestamp, level, and message
+            parts = line.split(" ", 3)
+            if len(parts) >= 4:
+                timestamp, level_part, service, message = parts
+
+                # Extract log level from [LEVEL] format
+                level = "INFO"
+                if "[" in level_part and "]" in level_part:
+                    level = level_part.strip("[]")
+
+                logs.append(
+                    {
+                        "timestamp": timestamp,
+                        "level": level,
+                        "service": service,
+                        "message": message,
+                    }
+                )
+            else:
+                logs.append({"message": line})
 
     return logs
 
@@ -73,19 +73,19 @@ def _run_servers():
         )
         output_thread.start()
 
-        time.sleep(2)  # Give each server time to start
+    # Servers start independently, so wait once for all of them to come up
+    if processes:
+        time.sleep(2)
 
     logging.info("\n" + "=" * 80)
     logging.info("All servers running. Press Ctrl+C to stop all servers.")
     logging.info("=" * 80 + "\n")
     logging.info("Test URLs:")
     for name, _, port in servers:
-        service_name = name.split()[0].lower()
         logging.info(f"  {name:<15}: https://localhost:{port}/")
 
     logging.info("\nAPI Documentation (add /docs to any URL):")
     for name, _, port in servers:
-        service_name = name.split()[0].lower()
         logging.info(f"  {name} Docs: https://localhost:{port}/docs")
 
     try:
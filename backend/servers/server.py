@@ -38,6 +38,8 @@ class ServerState:
     Shared servers state that is available between all protocol instances.
     """
 
+    __slots__ = ("total_requests", "connections", "tasks", "default_headers")
+
     def __init__(self) -> None:
         self.total_requests = 0
         self.connections: Set["Protocols"] = set()
@@ -1,5 +1,8 @@
+import errno
 import logging
+import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from config_utils import get_server_ports
 
@@ -10,58 +13,86 @@ logging.basicConfig(
     format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
 )
 
+# Wildcard addresses probed to see whether a port is taken on any interface
+_PROBE_ADDRESSES = ((socket.AF_INET6, "::"), (socket.AF_INET, ""))
+
+
+def _port_in_use(port: int) -> bool:
+    """Check whether a port is bound by trying to bind it in-process"""
+    probed = False
+    for family, address in _PROBE_ADDRESSES:
+        try:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                sock.bind((address, port))
+            probed = True
+        except OSError as e:
+            if e.errno == errno.EADDRINUSE:
+                return True
+    # If no probe could run, assume in use and let lsof/netstat decide
+    return not probed
+
+
+def _stop_server_on_port(port: int, name: str):
+    """Stop the stub server listening on a single port"""
+    if not _port_in_use(port):
+        logging.info(f"No {name} server found on port {port}")
+        return
+
+    try:
+        # Find processes using the port
+        result = subprocess.run(
+            ["lsof", "-ti", f":{port}"], capture_output=True, text=True
+        )
+
+        if result.returncode == 0 and result.stdout.strip():
+            pids = result.stdout.strip().split("\n")
+            for pid in pids:
+                if pid:
+                    logging.info(f"Stopping {name} server (PID: {pid}) on port {port}")
+                    subprocess.run(["kill", pid], check=False)
+        else:
+            logging.info(f"No {name} server found on port {port}")
+
+    except FileNotFoundError:
+        # lsof not available, try netstat approach
+        try:
+            result = subprocess.run(
+                ["netstat", "-tlnp"], capture_output=True, text=True
+            )
+
+            for line in result.stdout.split("\n"):
+                if f":{port}" in line and "LISTEN" in line:
+                    # Extract PID from netstat output
+                    parts = line.split()
+                    if len(parts) > 6:
+                        pid_info = parts[6]
+                        if "/" in pid_info:
+                            pid = pid_info.split("/")[0]
+                            if pid.isdigit():
+                                logging.info(
+                                    f"Stopping {name} server (PID: {pid}) on port {port}"
+                                )
+                                subprocess.run(["kill", pid], check=False)
+                                break
+
+        except Exception as e:
+            logging.error(f"Error stopping {name} server: {str(e)}")
+
 
 def _stop_servers():
     """Stop all running stub servers"""
     # Get ports from OpenAPI specifications
     port_config = get_server_ports()
+    if not port_config:
+        return
 
-    # Create lists of ports and names
+    # Look up and stop each port concurrently so the lsof/netstat
+    # subprocesses overlap instead of running back to back
     ports = list(port_config.values())
     server_names = [name.title() for name in port_config.keys()]
-
-    for port, name in zip(ports, server_names):
-        try:
-            # Find processes using the port
-            result = subprocess.run(
-                ["lsof", "-ti", f":{port}"], capture_output=True, text=True
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                pids = result.stdout.strip().split("\n")
-                for pid in pids:
-                    if pid:
-                        logging.info(
-                            f"Stopping {name} server (PID: {pid}) on port {port}"
-                        )
-                        subprocess.run(["kill", pid], check=False)
-            else:
-                logging.info(f"No {name} server found on port {port}")
-
-        except FileNotFoundError:
-            # lsof not available, try netstat approach
-            try:
-                result = subprocess.run(
-                    ["netstat", "-tlnp"], capture_output=True, text=True
-                )
-
-                for line in result.stdout.split("\n"):
-                    if f":{port}" in line and "LISTEN" in line:
-                        # Extract PID from netstat output
-                        parts = line.split()
-                        if len(parts) > 6:
-                            pid_info = parts[6]
-                            if "/" in pid_info:
-                                pid = pid_info.split("/")[0]
-                                if pid.isdigit():
-                                    logging.info(
-                                        f"Stopping {name} server (PID: {pid}) on port {port}"
-                                    )
-                                    subprocess.run(["kill", pid], check=False)
-                                    break
-
-            except Exception as e:
-                logging.error(f"Error stopping {name} server: {str(e)}")
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        # Consume the results so unexpected errors still propagate
+        list(executor.map(_stop_server_on_port, ports, server_names))
 
 
 def main():
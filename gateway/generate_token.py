@@ -22,6 +22,13 @@ logging.basicConfig(
     format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
 )
 
+# Environment variables needed to request a token
+REQUIRED_ENV_VARS = ("COGNITO_DOMAIN", "COGNITO_CLIENT_ID", "COGNITO_CLIENT_SECRET")
+
+# Shared session so repeated token requests reuse the keep-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=4))
+
 
 def _get_cognito_token(
     cognito_domain_url: str,
@@ -54,7 +61,7 @@ def _get_cognito_token(
             "scope": "invoke:gateway",
         }
         # Send as JSON for Auth0
-        response_method = lambda: requests.post(url, headers=headers, json=data)
+        response_method = lambda: _SESSION.post(url, headers=headers, json=data)
     else:
         # Cognito format
         url = f"{cognito_domain_url.rstrip('/')}/oauth2/token"
@@ -65,7 +72,7 @@ def _get_cognito_token(
             "client_secret": client_secret,
         }
         # Send as form data for Cognito
-        response_method = lambda: requests.post(url, headers=headers, data=data)
+        response_method = lambda: _SESSION.post(url, headers=headers, data=data)
 
     try:
         # Make the request
@@ -112,20 +119,11 @@ def generate_and_save_token(audience: str = "MCPGateway") -> None:
     dotenv.load_dotenv()
 
     # Get required environment variables
-    cognito_domain_url = os.environ.get("COGNITO_DOMAIN")
-    client_id = os.environ.get("COGNITO_CLIENT_ID")
-    client_secret = os.environ.get("COGNITO_CLIENT_SECRET")
+    env_values = {name: os.environ.get(name) for name in REQUIRED_ENV_VARS}
 
     # Validate that all required variables are present
-    if not all([cognito_domain_url, client_id, client_secret]):
-        missing_vars = []
-        if not cognito_domain_url:
-            missing_vars.append("COGNITO_DOMAIN")
-        if not client_id:
-            missing_vars.append("COGNITO_CLIENT_ID")
-        if not client_secret:
-            missing_vars.append("COGNITO_CLIENT_SECRET")
-
+    missing_vars = [name for name, value in env_values.items() if not value]
+    if missing_vars:
         logging.error(
             f"Missing required environment variables: {', '.join(missing_vars)}"
         )
@@ -136,9 +134,9 @@ def generate_and_save_token(audience: str = "MCPGateway") -> None:
 
     # Generate token
     token_response = _get_cognito_token(
-        cognito_domain_url=cognito_domain_url,
-        client_id=client_id,
-        client_secret=client_secret,
+        cognito_domain_url=env_values["COGNITO_DOMAIN"],
+        client_id=env_values["COGNITO_CLIENT_ID"],
+        client_secret=env_values["COGNITO_CLIENT_SECRET"],
         audience=audience,
     )
 
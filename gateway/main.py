@@ -10,6 +10,7 @@ gateways and adding OpenAPI targets from S3 or inline schemas.
 import argparse
 import json
 import logging
+import re
 import time
 from pathlib import Path
 from typing import Any, Dict
@@ -21,6 +22,9 @@ from botocore.exceptions import ClientError
 # Configuration constants
 GATEWAY_DELETION_PROPAGATION_DELAY = 3
 
+# Matches the region in endpoint URLs like "https://service.us-east-1.amazonaws.com"
+_ENDPOINT_REGION_RE = re.compile(r"\.([a-z0-9-]+)\.amazonaws\.com")
+
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -65,8 +69,7 @@ def _create_agentcore_client(region: str, endpoint_url: str) -> Any:
         Configured boto3 client for bedrock-agentcore-control
     """
     # Validate that the region matches the endpoint URL
-    import re
-    endpoint_region_match = re.search(r'\.([a-z0-9-]+)\.amazonaws\.com', endpoint_url)
+    endpoint_region_match = _ENDPOINT_REGION_RE.search(endpoint_url)
     if endpoint_region_match:
         endpoint_region = endpoint_region_match.group(1)
         if endpoint_region != region:
@@ -106,52 +109,54 @@ def _print_gateway_response(response: Dict[str, Any]) -> None:
     Args:
         response: Gateway creation response from AWS
     """
-    print("=" * 80)
-    print("GATEWAY CREATION RESPONSE")
-    print("=" * 80)
+    # Collect the report and emit it in one write
+    lines = ["=" * 80, "GATEWAY CREATION RESPONSE", "=" * 80]
 
     # Status and Basic Info
-    print(f"\n📊 Status: {response.get('status', 'N/A')}")
-    print(f"✅ HTTP Status: {response['ResponseMetadata']['HTTPStatusCode']}")
+    lines.append(f"\n📊 Status: {response.get('status', 'N/A')}")
+    lines.append(f"✅ HTTP Status: {response['ResponseMetadata']['HTTPStatusCode']}")
 
     # Gateway Details
-    print(f"\n🔗 Gateway URL: {response.get('gatewayUrl', 'N/A')}")
-    print(f"📌 Gateway ID: {response.get('gatewayId', 'N/A')}")
-    print(f"📝 Gateway Name: {response.get('name', 'N/A')}")
-    print(f"💬 Description: {response.get('description', 'N/A')}")
+    lines.append(f"\n🔗 Gateway URL: {response.get('gatewayUrl', 'N/A')}")
+    lines.append(f"📌 Gateway ID: {response.get('gatewayId', 'N/A')}")
+    lines.append(f"📝 Gateway Name: {response.get('name', 'N/A')}")
+    lines.append(f"💬 Description: {response.get('description', 'N/A')}")
 
     # ARN Information
-    print(f"\n🏷️  Gateway ARN: {response.get('gatewayArn', 'N/A')}")
-    print(f"👤 Role ARN: {response.get('roleArn', 'N/A')}")
+    lines.append(f"\n🏷️  Gateway ARN: {response.get('gatewayArn', 'N/A')}")
+    lines.append(f"👤 Role ARN: {response.get('roleArn', 'N/A')}")
 
     # Protocol Configuration
     protocol_config = response.get("protocolConfiguration", {}).get("mcp", {})
-    print(f"\n🔧 Protocol Type: {response.get('protocolType', 'N/A')}")
-    print(
+    lines.append(f"\n🔧 Protocol Type: {response.get('protocolType', 'N/A')}")
+    lines.append(
         f"📋 Supported Versions: {', '.join(protocol_config.get('supportedVersions', []))}"
     )
-    print(f"🔍 Search Type: {protocol_config.get('searchType', 'N/A')}")
+    lines.append(f"🔍 Search Type: {protocol_config.get('searchType', 'N/A')}")
 
     # Authorizer Configuration
     auth_config = response.get("authorizerConfiguration", {}).get(
         "customJWTAuthorizer", {}
     )
-    print(f"\n🔐 Authorizer Type: {response.get('authorizerType', 'N/A')}")
-    print(f"🌐 Discovery URL: {auth_config.get('discoveryUrl', 'N/A')}")
-    print(f"👥 Allowed Audience: {', '.join(auth_config.get('allowedAudience', []))}")
+    lines.append(f"\n🔐 Authorizer Type: {response.get('authorizerType', 'N/A')}")
+    lines.append(f"🌐 Discovery URL: {auth_config.get('discoveryUrl', 'N/A')}")
+    lines.append(
+        f"👥 Allowed Audience: {', '.join(auth_config.get('allowedAudience', []))}"
+    )
 
     # Timestamps
-    print(f"\n📅 Created At: {response.get('createdAt', 'N/A')}")
-    print(f"🔄 Updated At: {response.get('updatedAt', 'N/A')}")
+    lines.append(f"\n📅 Created At: {response.get('createdAt', 'N/A')}")
+    lines.append(f"🔄 Updated At: {response.get('updatedAt', 'N/A')}")
 
     # Request Metadata
     response_metadata = response["ResponseMetadata"]
     request_id = response_metadata["RequestId"]
     timestamp = response_metadata["HTTPHeaders"]["date"]
 
-    print(f"\n🆔 Request ID: {request_id}")
-    print(f"🕐 Timestamp: {timestamp}")
-    print("=" * 80)
+    lines.append(f"\n🆔 Request ID: {request_id}")
+    lines.append(f"🕐 Timestamp: {timestamp}")
+    lines.append("=" * 80)
+    print("\n".join(lines))
 
 
 def _save_gateway_url(gateway_url: str, output_file: str = ".gateway_uri") -> None:
@@ -29,8 +29,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 # Add the project root to path so we can import sre_agent
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -337,6 +335,9 @@ def _check_and_delete_existing_preference(
 
 def _load_user_preferences_from_yaml(yaml_file: Path) -> dict:
     """Load user preferences from YAML configuration file."""
+    # Imported here since only the update command needs YAML parsing
+    import yaml
+
     try:
         with open(yaml_file, "r") as f:
             config = yaml.safe_load(f)
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Type
 
 import yaml
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -17,6 +17,9 @@ from .llm_utils import create_llm_with_error_handling
 from .memory import SREMemoryClient, create_conversation_memory_manager
 from .prompt_loader import prompt_loader
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader: Type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Logging will be configured by the main entry point
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,7 @@ def _load_agent_config() -> Dict[str, Any]:
     """Load agent configuration from YAML file."""
     config_path = Path(__file__).parent / "config" / "agent_config.yaml"
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def _create_llm(provider: str = "bedrock", **kwargs):
@@ -39,11 +42,11 @@ def _filter_tools_for_agent(
 ) -> List[BaseTool]:
     """Filter tools based on agent configuration."""
     agent_config = config["agents"].get(agent_name, {})
-    allowed_tools = agent_config.get("tools", [])
 
-    # Also include global tools
-    global_tools = config.get("global_tools", [])
-    allowed_tools.extend(global_tools)
+    # Also include global tools. Build a new set rather than extending the
+    # agent's tool list, which belongs to the cached config.
+    allowed_tools = set(agent_config.get("tools", []))
+    allowed_tools.update(config.get("global_tools", []))
 
     # Filter tools based on their names
     filtered_tools = []
@@ -71,7 +74,7 @@ def _filter_tools_for_agent(
         logger.info(f"  - {tool_name}: {description_first_line}")
 
     # Debug: Show what was allowed vs what was available
-    logger.debug(f"Agent {agent_name} allowed tools: {allowed_tools}")
+    logger.debug(f"Agent {agent_name} allowed tools: {sorted(allowed_tools)}")
     all_tool_names = [getattr(tool, "name", "unknown") for tool in all_tools]
     logger.debug(f"Agent {agent_name} available tools: {all_tool_names}")
 
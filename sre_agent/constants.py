@@ -2,7 +2,7 @@
 
 import logging
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class ModelConfig(BaseModel):
     """Model configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Anthropic model IDs
     anthropic_model_id: str = Field(
         default="claude-sonnet-4-20250514",
@@ -55,6 +57,8 @@ class ModelConfig(BaseModel):
 class AWSConfig(BaseModel):
     """AWS configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_region: str = Field(default="us-east-1", description="Default AWS region")
 
     bedrock_endpoint_url: str = Field(
@@ -71,6 +75,8 @@ class AWSConfig(BaseModel):
 class TimeoutConfig(BaseModel):
     """Timeout configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     graph_execution_timeout_seconds: int = Field(
         default=600,
         ge=1,
@@ -89,6 +95,8 @@ class TimeoutConfig(BaseModel):
 class PromptConfig(BaseModel):
     """Prompt configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     prompts_directory: str = Field(
         default="config/prompts",
         description="Directory containing prompt template files",
@@ -141,6 +149,8 @@ class PromptConfig(BaseModel):
 class ApplicationConfig(BaseModel):
     """Application configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_model_name: str = Field(
         default="sre-multi-agent", description="Model name returned in API responses"
     )
@@ -164,6 +174,8 @@ class ApplicationConfig(BaseModel):
 class AgentMetadata(BaseModel):
     """Metadata for a single agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     actor_id: str = Field(description="Unique actor ID for memory operations")
     display_name: str = Field(description="Human-readable agent name")
     description: str = Field(description="Agent capabilities description")
@@ -173,6 +185,8 @@ class AgentMetadata(BaseModel):
 class MemoryConfig(BaseModel):
     """Memory system configuration constants."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Query constants for comprehensive memory retrieval
     user_preferences_query: str = Field(
         default="user settings communication escalation notification reporting workflow preferences",
@@ -213,6 +227,8 @@ class MemoryConfig(BaseModel):
 class AgentsConstant(BaseModel):
     """Agent-specific constants for the SRE system."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_actor_id: str = Field(
         default="sre-agent",
         description="Default actor ID used for saving and retrieving memories",
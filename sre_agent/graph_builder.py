@@ -26,6 +26,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Markdown document wrapping the exported Mermaid diagram
+_GRAPH_MARKDOWN_TEMPLATE = "# SRE Agent Architecture\n\n```mermaid\n{diagram}\n```\n"
+
 
 def _should_continue(state: AgentState) -> Literal["supervisor", "FINISH"]:
     """Determine if we should continue or finish."""
@@ -195,11 +198,9 @@ def build_multi_agent_graph(
             mermaid_diagram = compiled_graph.get_graph().draw_mermaid()
             
             # Save to file
-            with open(graph_output_path, "w") as f:
-                f.write("# SRE Agent Architecture\n\n")
-                f.write("```mermaid\n")
-                f.write(mermaid_diagram)
-                f.write("\n```\n")
+            output_path.write_text(
+                _GRAPH_MARKDOWN_TEMPLATE.format(diagram=mermaid_diagram)
+            )
             
             logger.info(f"Graph architecture (Mermaid) exported to: {graph_output_path}")
             print(f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}")
@@ -6,8 +6,9 @@ This module provides a single point for LLM creation with proper error handling
 for authentication, access, and configuration issues.
 """
 
+import functools
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from langchain_anthropic import ChatAnthropic
 from langchain_aws import ChatBedrock
@@ -16,6 +17,35 @@ from .constants import SREConstants
 
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_PROVIDERS = frozenset({"anthropic", "bedrock"})
+
+# Most distinct provider/override combinations whose LLM clients are kept
+_LLM_CACHE_SIZE = 16
+
+# Substrings used to classify provider errors
+_AUTH_ERROR_KEYWORDS = (
+    "authentication",
+    "unauthorized",
+    "invalid credentials",
+    "api key",
+    "access key",
+    "token",
+    "permission denied",
+    "403",
+    "401",
+)
+
+_ACCESS_ERROR_KEYWORDS = (
+    "access denied",
+    "forbidden",
+    "not authorized",
+    "insufficient permissions",
+    "quota exceeded",
+    "rate limit",
+    "service unavailable",
+    "region not supported",
+)
+
 
 class LLMProviderError(Exception):
     """Exception raised when LLM provider creation fails."""
@@ -51,7 +81,7 @@ def create_llm_with_error_handling(provider: str = "bedrock", **kwargs):
         LLMAccessError: For access/permission failures
         ValueError: For unsupported providers
     """
-    if provider not in ["anthropic", "bedrock"]:
+    if provider not in _SUPPORTED_PROVIDERS:
         raise ValueError(
             f"Unsupported provider: {provider}. Use 'anthropic' or 'bedrock'"
         )
@@ -59,16 +89,10 @@ def create_llm_with_error_handling(provider: str = "bedrock", **kwargs):
     logger.info(f"Creating LLM with provider: {provider}")
 
     try:
-        config = SREConstants.get_model_config(provider, **kwargs)
-
-        if provider == "anthropic":
-            logger.info(f"Creating Anthropic LLM - Model: {config['model_id']}")
-            return _create_anthropic_llm(config)
-        else:  # bedrock
-            logger.info(
-                f"Creating Bedrock LLM - Model: {config['model_id']}, Region: {config['region_name']}"
-            )
-            return _create_bedrock_llm(config)
+        cache_key = _llm_cache_key(kwargs)
+        if cache_key is None:
+            return _build_llm(provider, **kwargs)
+        return _build_llm_cached(provider, cache_key)
 
     except Exception as e:
         error_msg = _get_helpful_error_message(provider, e)
@@ -83,6 +107,41 @@ def create_llm_with_error_handling(provider: str = "bedrock", **kwargs):
             raise LLMProviderError(error_msg) from e
 
 
+def _llm_cache_key(kwargs: Dict[str, Any]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Build a cache key from config overrides, or None if they are unhashable."""
+    cache_key = tuple(sorted(kwargs.items()))
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def _build_llm(provider: str, **kwargs):
+    """Create a new LLM instance for a provider."""
+    config = SREConstants.get_model_config(provider, **kwargs)
+
+    if provider == "anthropic":
+        logger.info(f"Creating Anthropic LLM - Model: {config['model_id']}")
+        return _create_anthropic_llm(config)
+    else:  # bedrock
+        logger.info(
+            f"Creating Bedrock LLM - Model: {config['model_id']}, Region: {config['region_name']}"
+        )
+        return _create_bedrock_llm(config)
+
+
+@functools.lru_cache(maxsize=_LLM_CACHE_SIZE)
+def _build_llm_cached(provider: str, cache_key: Tuple[Tuple[str, Any], ...]):
+    """Create an LLM once per provider and overrides; failures are not cached."""
+    return _build_llm(provider, **dict(cache_key))
+
+
+def _clear_llm_cache() -> None:
+    """Drop all cached LLM instances, e.g. after credentials change."""
+    _build_llm_cached.cache_clear()
+
+
 def _create_anthropic_llm(config: Dict[str, Any]):
     """Create Anthropic LLM instance."""
     return ChatAnthropic(
@@ -107,34 +166,13 @@ def _create_bedrock_llm(config: Dict[str, Any]):
 def _is_auth_error(error: Exception) -> bool:
     """Check if error is authentication-related."""
     error_str = str(error).lower()
-    auth_keywords = [
-        "authentication",
-        "unauthorized",
-        "invalid credentials",
-        "api key",
-        "access key",
-        "token",
-        "permission denied",
-        "403",
-        "401",
-    ]
-    return any(keyword in error_str for keyword in auth_keywords)
+    return any(keyword in error_str for keyword in _AUTH_ERROR_KEYWORDS)
 
 
 def _is_access_error(error: Exception) -> bool:
     """Check if error is access/permission-related."""
     error_str = str(error).lower()
-    access_keywords = [
-        "access denied",
-        "forbidden",
-        "not authorized",
-        "insufficient permissions",
-        "quota exceeded",
-        "rate limit",
-        "service unavailable",
-        "region not supported",
-    ]
-    return any(keyword in error_str for keyword in access_keywords)
+    return any(keyword in error_str for keyword in _ACCESS_ERROR_KEYWORDS)
 
 
 def _get_helpful_error_message(provider: str, error: Exception) -> str:
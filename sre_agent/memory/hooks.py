@@ -24,6 +24,102 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Knowledge types accepted from agent infrastructure_knowledge blocks
+_VALID_KNOWLEDGE_TYPES = ("dependency", "pattern", "config", "baseline")
+
+# Agents whose responses carry infrastructure knowledge, by display name
+_INFRASTRUCTURE_AGENTS = frozenset(
+    SREConstants.agents.agents[agent_id].display_name
+    for agent_id in ("kubernetes", "metrics", "logs")
+)
+
+# Substrings in a final response that mark an investigation's outcome
+_COMPLETED_KEYWORDS = ("resolved", "fixed", "solved", "completed")
+_ESCALATED_KEYWORDS = ("escalat", "contact", "need help")
+
+# Extraction regexes, compiled once at import rather than on every response
+_ESCALATION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"escalate to ([^\s,\.]+@[^\s,\.]+)",
+        r"contact ([^\s,\.]+@[^\s,\.]+)",
+        r"notify ([^\s,\.]+@[^\s,\.]+)",
+        r"reach out to ([^\s,\.]+@[^\s,\.]+)",
+    )
+)
+_CHANNEL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"send to (#[\w-]+)",
+        r"notify (#[\w-]+)",
+        r"alert (#[\w-]+)",
+        r"post to (#[\w-]+)",
+    )
+)
+_FINDING_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:found|discovered|identified|detected):\s*([^\.]+)",
+        r"(?:issue|problem|error):\s*([^\.]+)",
+        r"(?:solution|fix|resolution):\s*([^\.]+)",
+    )
+)
+# JSON blocks containing infrastructure_knowledge
+_INFRASTRUCTURE_JSON_RE = re.compile(
+    r'```json\s*\n\s*(\{[^`]*"infrastructure_knowledge"[^`]*\})\s*\n\s*```',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _validate_knowledge_items(
+    knowledge_items: List[Dict[str, Any]], agent_name: str
+) -> List[InfrastructureKnowledge]:
+    """Validate a batch of infrastructure knowledge items from one JSON block.
+
+    Invalid items are logged and skipped so the rest of the batch still gets saved.
+    """
+    default_context = f"Discovered by {agent_name} agent"
+    extracted_at = datetime.utcnow()
+
+    validated = []
+    for knowledge_item in knowledge_items:
+        try:
+            # Validate required fields
+            service_name = knowledge_item.get("service_name")
+            knowledge_type = knowledge_item.get("knowledge_type")
+            if not service_name or not knowledge_type:
+                logger.warning(
+                    "Skipping invalid knowledge item: missing service_name or knowledge_type"
+                )
+                continue
+
+            # Validate knowledge_type
+            if knowledge_type not in _VALID_KNOWLEDGE_TYPES:
+                logger.warning(
+                    f"Invalid knowledge_type '{knowledge_type}', must be one of: {list(_VALID_KNOWLEDGE_TYPES)}"
+                )
+                continue
+
+            # Add agent metadata to knowledge data
+            knowledge_data = knowledge_item.get("knowledge_data", {})
+            knowledge_data["discovered_by"] = agent_name
+
+            # Create InfrastructureKnowledge object with explicit timestamp
+            validated.append(
+                InfrastructureKnowledge(
+                    service_name=service_name,
+                    knowledge_type=knowledge_type,
+                    knowledge_data=knowledge_data,
+                    confidence=float(knowledge_item.get("confidence", 0.8)),
+                    context=knowledge_item.get("context", default_context),
+                    timestamp=extracted_at,  # Explicit timestamp when knowledge was extracted
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error processing knowledge item: {e}")
+
+    return validated
+
 
 class MemoryHookProvider:
     """Provides hooks for automatic memory capture during SRE operations."""
@@ -170,14 +266,7 @@ class MemoryHookProvider:
 
             # Extract infrastructure knowledge
             # Check if this agent should extract infrastructure knowledge
-            # Match against display names from constants
-            infrastructure_agents = [
-                SREConstants.agents.agents["kubernetes"].display_name,
-                SREConstants.agents.agents["metrics"].display_name,
-                SREConstants.agents.agents["logs"].display_name,
-            ]
-
-            if agent_name in infrastructure_agents:
+            if agent_name in _INFRASTRUCTURE_AGENTS:
                 logger.info(f"Extracting infrastructure knowledge from {agent_name}")
                 self._extract_infrastructure_knowledge(
                     response_text, agent_name, user_id, state
@@ -254,16 +343,9 @@ class MemoryHookProvider:
         )
 
         # Extract escalation preferences
-        escalation_patterns = [
-            r"escalate to ([^\s,\.]+@[^\s,\.]+)",
-            r"contact ([^\s,\.]+@[^\s,\.]+)",
-            r"notify ([^\s,\.]+@[^\s,\.]+)",
-            r"reach out to ([^\s,\.]+@[^\s,\.]+)",
-        ]
-
         escalation_found = 0
-        for pattern in escalation_patterns:
-            matches = re.finditer(pattern, response_text, re.IGNORECASE)
+        for pattern in _ESCALATION_PATTERNS:
+            matches = pattern.finditer(response_text)
             for match in matches:
                 contact = match.group(1)
                 logger.info(
@@ -289,16 +371,9 @@ class MemoryHookProvider:
             logger.info(f"No escalation patterns found in {context} response")
 
         # Extract notification channel preferences
-        channel_patterns = [
-            r"send to (#[\w-]+)",
-            r"notify (#[\w-]+)",
-            r"alert (#[\w-]+)",
-            r"post to (#[\w-]+)",
-        ]
-
         channels_found = 0
-        for pattern in channel_patterns:
-            matches = re.finditer(pattern, response_text, re.IGNORECASE)
+        for pattern in _CHANNEL_PATTERNS:
+            matches = pattern.finditer(response_text)
             for match in matches:
                 channel = match.group(1)
                 logger.info(
@@ -336,12 +411,7 @@ class MemoryHookProvider:
         )
 
         # Look for JSON infrastructure knowledge blocks in the response
-
-        # Find JSON blocks containing infrastructure_knowledge
-        json_pattern = (
-            r'```json\s*\n\s*(\{[^`]*"infrastructure_knowledge"[^`]*\})\s*\n\s*```'
-        )
-        matches = re.finditer(json_pattern, response_text, re.IGNORECASE | re.DOTALL)
+        matches = _INFRASTRUCTURE_JSON_RE.finditer(response_text)
 
         knowledge_extracted = 0
 
@@ -360,44 +430,10 @@ class MemoryHookProvider:
                     logger.info("No infrastructure knowledge items found in JSON block")
                     continue
 
-                for knowledge_item in infrastructure_knowledge_list:
+                for knowledge in _validate_knowledge_items(
+                    infrastructure_knowledge_list, agent_name
+                ):
                     try:
-                        # Validate required fields
-                        service_name = knowledge_item.get("service_name")
-                        knowledge_type = knowledge_item.get("knowledge_type")
-                        knowledge_data = knowledge_item.get("knowledge_data", {})
-                        confidence = knowledge_item.get("confidence", 0.8)
-                        context = knowledge_item.get(
-                            "context", f"Discovered by {agent_name} agent"
-                        )
-
-                        if not service_name or not knowledge_type:
-                            logger.warning(
-                                "Skipping invalid knowledge item: missing service_name or knowledge_type"
-                            )
-                            continue
-
-                        # Validate knowledge_type
-                        valid_types = ["dependency", "pattern", "config", "baseline"]
-                        if knowledge_type not in valid_types:
-                            logger.warning(
-                                f"Invalid knowledge_type '{knowledge_type}', must be one of: {valid_types}"
-                            )
-                            continue
-
-                        # Add agent metadata to knowledge data
-                        knowledge_data["discovered_by"] = agent_name
-
-                        # Create InfrastructureKnowledge object with explicit timestamp
-                        knowledge = InfrastructureKnowledge(
-                            service_name=service_name,
-                            knowledge_type=knowledge_type,
-                            knowledge_data=knowledge_data,
-                            confidence=float(confidence),
-                            context=context,
-                            timestamp=datetime.utcnow(),  # Explicit timestamp when knowledge was extracted
-                        )
-
                         # Save to memory using user_id as actor_id (not service_name)
                         success = _save_infrastructure_knowledge(
                             self.memory_client,
@@ -409,11 +445,11 @@ class MemoryHookProvider:
                         if success:
                             knowledge_extracted += 1
                             logger.info(
-                                f"Captured {knowledge_type} knowledge for {service_name}: {knowledge_data}"
+                                f"Captured {knowledge.knowledge_type} knowledge for {knowledge.service_name}: {knowledge.knowledge_data}"
                             )
                         else:
                             logger.warning(
-                                f"Failed to save {knowledge_type} knowledge for {service_name}"
+                                f"Failed to save {knowledge.knowledge_type} knowledge for {knowledge.service_name}"
                             )
 
                     except Exception as e:
@@ -478,14 +514,8 @@ class MemoryHookProvider:
         findings = []
 
         # Look for common finding patterns
-        finding_patterns = [
-            r"(?:found|discovered|identified|detected):\s*([^\.]+)",
-            r"(?:issue|problem|error):\s*([^\.]+)",
-            r"(?:solution|fix|resolution):\s*([^\.]+)",
-        ]
-
-        for pattern in finding_patterns:
-            matches = re.finditer(pattern, final_response, re.IGNORECASE)
+        for pattern in _FINDING_PATTERNS:
+            matches = pattern.finditer(final_response)
             for match in matches:
                 finding = match.group(1).strip()
                 if finding and len(finding) > 10:  # Filter out very short findings
@@ -497,14 +527,9 @@ class MemoryHookProvider:
         """Determine resolution status from final response."""
         response_lower = final_response.lower()
 
-        if any(
-            word in response_lower
-            for word in ["resolved", "fixed", "solved", "completed"]
-        ):
+        if any(word in response_lower for word in _COMPLETED_KEYWORDS):
             return "completed"
-        elif any(
-            word in response_lower for word in ["escalat", "contact", "need help"]
-        ):
+        elif any(word in response_lower for word in _ESCALATED_KEYWORDS):
             return "escalated"
         else:
             return "ongoing"
@@ -14,27 +14,28 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Map memory categories to preference types
+_CATEGORY_PREFERENCE_TYPES = {
+    "escalation": "escalation",
+    "notification": "notification",
+    "notifications": "notification",
+    "workflow": "workflow",
+    "communication": "style",
+    "business": "style",
+    "automation": "workflow",
+}
+
 
 def _infer_preference_type(categories: List[str]) -> str:
     """Infer preference type from categories."""
     if not categories:
         return "general"
 
-    # Map categories to preference types
-    category_mapping = {
-        "escalation": "escalation",
-        "notification": "notification",
-        "notifications": "notification",
-        "workflow": "workflow",
-        "communication": "style",
-        "business": "style",
-        "automation": "workflow",
-    }
-
     # Return the first matching category, or default to the first category
     for category in categories:
-        if category.lower() in category_mapping:
-            return category_mapping[category.lower()]
+        preference_type = _CATEGORY_PREFERENCE_TYPES.get(category.lower())
+        if preference_type:
+            return preference_type
 
     # Fallback to first category or default
     return categories[0].lower() if categories else "general"
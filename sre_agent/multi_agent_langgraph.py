@@ -9,19 +9,20 @@ import random
 import re
 import shutil
 import sys
+import tempfile
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.tools import tool
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.errors import GraphRecursionError
 
+from .agent_nodes import _load_agent_config
 from .agent_state import AgentState
 from .constants import SREConstants
 from .graph_builder import build_multi_agent_graph
@@ -35,8 +36,26 @@ if not logging.getLogger().handlers:
 
 logger = logging.getLogger(__name__)
 
+# Environment file in sre_agent directory and the mtime it was last loaded at
+_ENV_FILE = Path(__file__).parent / ".env"
+_env_file_mtime_ns: Optional[int] = None
+
+
+def _load_env_file() -> None:
+    """Load environment variables from .env, skipping the parse if unchanged."""
+    global _env_file_mtime_ns
+    try:
+        mtime_ns = _ENV_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+
+    if mtime_ns != _env_file_mtime_ns:
+        load_dotenv(_ENV_FILE)
+        _env_file_mtime_ns = mtime_ns
+
+
 # Load environment variables from .env file in sre_agent directory
-load_dotenv(Path(__file__).parent / ".env")
+_load_env_file()
 
 
 def _get_user_from_env() -> str:
@@ -83,6 +102,15 @@ def _get_session_from_env(mode: str) -> str:
 class Spinner:
     """Simple spinner animation with elapsed time display."""
 
+    __slots__ = (
+        "message",
+        "show_time",
+        "spinning",
+        "thread",
+        "start_time",
+        "spinner_chars",
+    )
+
     def __init__(self, message: str = "Thinking", show_time: bool = True):
         self.message = message
         self.show_time = show_time
@@ -316,21 +344,19 @@ def _read_gateway_config() -> tuple[str, str]:
     """Read gateway URI from config and access token from environment."""
     try:
         # Load environment variables from sre_agent directory
-        load_dotenv(Path(__file__).parent / ".env")
+        _load_env_file()
 
         # Read gateway URI and region from agent_config.yaml
-        config_path = Path(__file__).parent / "config" / "agent_config.yaml"
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_agent_config()
 
-        gateway_uri = config.get("gateway", {}).get("uri")
+        gateway_uri = (config.get("gateway") or {}).get("uri")
         if not gateway_uri:
             raise ValueError(
                 "Gateway URI not found in agent_config.yaml under 'gateway.uri'"
             )
         
         # Get AWS region with fallback logic: config -> AWS_REGION env var -> us-east-1
-        aws_region = config.get("aws", {}).get("region")
+        aws_region = (config.get("aws") or {}).get("region")
         if not aws_region:
             aws_region = os.environ.get("AWS_REGION", "us-east-1")
 
@@ -585,6 +611,7 @@ def _save_conversation_state(
     filename: str = SREConstants.app.conversation_state_file,
 ):
     """Save conversation state to a file."""
+    tmp_path = None
     try:
         # Convert messages to serializable format
         serializable_messages = []
@@ -612,7 +639,18 @@ def _save_conversation_state(
                 else:
                     serializable_state[k] = str(v)
 
-        with open(filename, "w") as f:
+        # Write to a uniquely named temp file in the same directory and swap it
+        # in, so a crash never leaves a partially written state file behind
+        # for /load and concurrent saves never share a temp file
+        state_path = Path(filename)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=state_path.parent,
+            prefix=f".{state_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_path = f.name
             json.dump(
                 {
                     "messages": serializable_messages,
@@ -622,9 +660,18 @@ def _save_conversation_state(
                 f,
                 indent=2,
             )
+        os.replace(tmp_path, filename)
+        tmp_path = None
         logger.debug(f"Saved conversation state to {filename}")
     except Exception as e:
         logger.error(f"Failed to save conversation state: {e}")
+    finally:
+        # Remove the temp file if the dump or the replace failed
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
 def _load_conversation_state(
@@ -1161,12 +1208,10 @@ async def main():
     
     # Load AWS region with fallback logic: config -> AWS_REGION env var -> us-east-1
     try:
-        config_path = Path(__file__).parent / "config" / "agent_config.yaml"
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_agent_config()
         
         # Try to get region from config first
-        aws_region = config.get("aws", {}).get("region")
+        aws_region = (config.get("aws") or {}).get("region")
         
         if aws_region:
             logger.info(f"Using AWS region from agent_config.yaml: {aws_region}")
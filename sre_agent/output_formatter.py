@@ -44,7 +44,10 @@ class SREOutputFormatter:
         )
 
     def _extract_steps_from_response(self, response: str) -> List[str]:
-        """Extract numbered steps from agent response."""
+        """Extract numbered steps from agent response.
+
+        Returned steps are already whitespace-stripped.
+        """
         if not response:
             return []
 
@@ -114,14 +117,12 @@ class SREOutputFormatter:
                         output.append("")
                         output.append("**Runbook Steps Found:**")
                         for step in steps:
-                            # Clean up step formatting
-                            clean_step = step.strip()
-                            if clean_step.startswith(
+                            if step.startswith(
                                 ("1.", "2.", "3.", "4.", "5.", "6.", "7.", "8.", "9.")
                             ):
-                                output.append(f"{clean_step}")
+                                output.append(step)
                             else:
-                                output.append(f"- {clean_step}")
+                                output.append(f"- {step}")
                         output.append("")
                     else:
                         # Show full response if no steps found
@@ -48,15 +48,14 @@ class PromptLoader:
         """
         filepath = self.prompts_dir / filename
 
-        if not filepath.exists():
-            raise FileNotFoundError(f"Prompt file not found: {filepath}")
-
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 content = f.read().strip()
 
             logger.debug(f"Loaded prompt file: {filename}")
             return content
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {filepath}") from None
         except Exception as e:
             logger.error(f"Error loading prompt file {filename}: {e}")
             raise IOError(f"Failed to read prompt file {filename}: {e}")
@@ -150,8 +150,9 @@ def _read_supervisor_prompt() -> str:
             / "prompts"
             / "supervisor_multi_agent_prompt.txt"
         )
-        if prompt_path.exists():
-            return prompt_path.read_text().strip()
+        return prompt_path.read_text().strip()
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not read supervisor prompt file: {e}")
 
@@ -163,8 +164,9 @@ def _read_supervisor_prompt() -> str:
             / "prompts"
             / "supervisor_fallback_prompt.txt"
         )
-        if fallback_path.exists():
-            return fallback_path.read_text().strip()
+        return fallback_path.read_text().strip()
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not read supervisor fallback prompt file: {e}")
 
@@ -183,8 +185,9 @@ def _read_planning_prompt() -> str:
             / "prompts"
             / "supervisor_planning_prompt.txt"
         )
-        if prompt_path.exists():
-            return prompt_path.read_text().strip()
+        return prompt_path.read_text().strip()
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not read planning prompt file: {e}")
 
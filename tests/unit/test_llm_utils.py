@@ -0,0 +1,73 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sre_agent.llm_utils import (
+    LLMProviderError,
+    _clear_llm_cache,
+    create_llm_with_error_handling,
+)
+
+
+class TestLLMCache:
+    """Tests for LLM instance caching in create_llm_with_error_handling."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Isolate each test from LLMs cached by other tests."""
+        _clear_llm_cache()
+        yield
+        _clear_llm_cache()
+
+    @pytest.fixture
+    def mock_create_anthropic(self):
+        """Patch the Anthropic constructor to return a fresh mock per call."""
+        with patch(
+            "sre_agent.llm_utils._create_anthropic_llm",
+            side_effect=lambda config: Mock(),
+        ) as mock_create:
+            yield mock_create
+
+    def test_same_settings_reuse_instance(self, mock_create_anthropic):
+        """Test repeated calls with the same settings return the cached LLM."""
+        first = create_llm_with_error_handling("anthropic", max_tokens=100)
+        second = create_llm_with_error_handling("anthropic", max_tokens=100)
+
+        assert first is second
+        mock_create_anthropic.assert_called_once()
+
+    def test_different_settings_create_new_instance(self, mock_create_anthropic):
+        """Test different overrides produce separate LLMs."""
+        first = create_llm_with_error_handling("anthropic", max_tokens=100)
+        second = create_llm_with_error_handling("anthropic", max_tokens=200)
+
+        assert first is not second
+        assert mock_create_anthropic.call_count == 2
+
+    def test_unhashable_settings_bypass_cache(self, mock_create_anthropic):
+        """Test unhashable overrides still create an LLM, uncached."""
+        first = create_llm_with_error_handling("anthropic", stop=["END"])
+        second = create_llm_with_error_handling("anthropic", stop=["END"])
+
+        assert first is not second
+        assert mock_create_anthropic.call_count == 2
+
+    def test_failures_are_not_cached(self, mock_create_anthropic):
+        """Test a failed creation is retried on the next call."""
+        llm = Mock()
+        mock_create_anthropic.side_effect = [Exception("boom"), llm]
+
+        with pytest.raises(LLMProviderError):
+            create_llm_with_error_handling("anthropic")
+
+        assert create_llm_with_error_handling("anthropic") is llm
+        assert mock_create_anthropic.call_count == 2
+
+    def test_clear_cache_forces_new_instance(self, mock_create_anthropic):
+        """Test clearing the cache drops previously created LLMs."""
+        first = create_llm_with_error_handling("anthropic")
+        _clear_llm_cache()
+        second = create_llm_with_error_handling("anthropic")
+
+        assert first is not second
+        assert mock_create_anthropic.call_count == 2
@@ -7,12 +7,12 @@ hallucinations and verify the accuracy of claims made in the reports.
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
 from pathlib import Path
 
-import anthropic
 from dotenv import load_dotenv
 
 # Configure logging
@@ -23,36 +23,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(Path(__file__).parent / "sre_agent" / ".env")
 
-
-def _get_anthropic_api_key() -> str:
-    """Get Anthropic API key from environment variables."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "ANTHROPIC_API_KEY environment variable is required for verification"
-        )
-    return api_key
-
-
-def _read_file(file_path: str) -> str:
-    """Read content from a file."""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Error reading file {file_path}: {e}")
-        sys.exit(1)
-
-
-def _create_verification_prompt(report_content: str, ground_truth_content: str) -> str:
-    """Create the verification prompt for Claude."""
-    return f"""<task>
+# Verification prompt, filled in with the report and ground truth data
+_VERIFICATION_PROMPT_TEMPLATE = """<task>
 You are an expert SRE data verification specialist. Your task is to verify the accuracy of an SRE investigation report by comparing it against ground truth data.
 
 <report>
@@ -131,11 +104,67 @@ All claims in the report have been verified against the ground truth data. No fa
 Be extremely thorough and precise. SRE operations require absolute accuracy - even small discrepancies in timestamps, pod names, or metric values are critical to identify.
 </instructions>"""
 
+# Console header and footer around the verification results
+_RESULTS_SEPARATOR = "=" * 80
+_RESULTS_BANNER = (
+    f"\n{_RESULTS_SEPARATOR}\nSRE REPORT VERIFICATION RESULTS\n{_RESULTS_SEPARATOR}\n"
+)
+
+# Layout of the optional --output results file
+_RESULTS_FILE_TEMPLATE = (
+    "# SRE Report Verification Results\n\n"
+    "**Report**: {report_path}\n"
+    "**Ground Truth**: {data_path}\n"
+    "**Verified on**: {cwd}\n\n"
+    "---\n\n"
+    "{result}"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from sre_agent/.env once per process."""
+    load_dotenv(Path(__file__).parent / "sre_agent" / ".env")
+
+
+def _get_anthropic_api_key() -> str:
+    """Get Anthropic API key from environment variables."""
+    _load_env()
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "ANTHROPIC_API_KEY environment variable is required for verification"
+        )
+    return api_key
+
+
+def _read_file(file_path: str) -> str:
+    """Read content from a file."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.error(f"File not found: {file_path}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Error reading file {file_path}: {e}")
+        sys.exit(1)
+
+
+def _create_verification_prompt(report_content: str, ground_truth_content: str) -> str:
+    """Create the verification prompt for Claude."""
+    return _VERIFICATION_PROMPT_TEMPLATE.format(
+        report_content=report_content, ground_truth_content=ground_truth_content
+    )
+
 
 def _verify_report_with_claude(
     report_content: str, ground_truth_content: str, api_key: str
 ) -> str:
     """Use Claude to verify the report against ground truth data."""
+    # Imported here so argument and input validation do not pay for the SDK
+    import anthropic
+
     try:
         client = anthropic.Anthropic(api_key=api_key)
 
@@ -206,22 +235,21 @@ def main():
     )
 
     # Output results
-    print("\n" + "=" * 80)
-    print("SRE REPORT VERIFICATION RESULTS")
-    print("=" * 80)
-    print(verification_result)
-    print("=" * 80)
+    sys.stdout.write(f"{_RESULTS_BANNER}{verification_result}\n{_RESULTS_SEPARATOR}\n")
+    sys.stdout.flush()
 
     # Save to output file if specified
     if args.output:
         try:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write("# SRE Report Verification Results\n\n")
-                f.write(f"**Report**: {args.report_path}\n")
-                f.write(f"**Ground Truth**: {args.data_path}\n")
-                f.write(f"**Verified on**: {Path().cwd()}\n\n")
-                f.write("---\n\n")
-                f.write(verification_result)
+            Path(args.output).write_text(
+                _RESULTS_FILE_TEMPLATE.format(
+                    report_path=args.report_path,
+                    data_path=args.data_path,
+                    cwd=Path().cwd(),
+                    result=verification_result,
+                ),
+                encoding="utf-8",
+            )
             logger.info(f"Verification results saved to: {args.output}")
         except Exception as e:
             logger.error(f"Error saving output file: {e}")